@@ -127,16 +127,12 @@ def test_receive_owner_level(connstr_senders, uamqp_transport):
                                    kwargs={"partition_id": "0", "starting_position": "-1",
                                            "on_error": on_error})
         thread1.start()
-        for i in range(5):
-            ed = EventData("Event Number {}".format(i))
-            senders[0].send(ed)
+        senders[0].send([EventData("Event Number {}".format(i)) for i in range(5)])
         time.sleep(10)
         thread2 = threading.Thread(target=client2.receive, args=(on_event,),
                                    kwargs = {"partition_id": "0", "starting_position": "-1", "owner_level": 1})
         thread2.start()
-        for i in range(5):
-            ed = EventData("Event Number {}".format(i))
-            senders[0].send(ed)
+        senders[0].send([EventData("Event Number {}".format(i)) for i in range(5)])
         time.sleep(20)
     thread1.join()
     thread2.join()
@@ -152,9 +148,12 @@ def test_receive_over_websocket_sync(connstr_senders, uamqp_transport):
     def on_event(partition_context, event):
         on_event.received.append(event)
         on_event.app_prop = event.properties
+        if len(on_event.received) >= 6:
+            on_event.done.set()
 
     on_event.received = []
     on_event.app_prop = None
+    on_event.done = threading.Event()
     connection_str, senders = connstr_senders
     client = EventHubConsumerClient.from_connection_string(connection_str,
                                                            consumer_group='$default',
@@ -181,10 +180,9 @@ def test_receive_over_websocket_sync(connstr_senders, uamqp_transport):
         thread = threading.Thread(target=client.receive, args=(on_event,),
                                   kwargs={"partition_id": "0", "starting_position": "-1"})
         thread.start()
-        time.sleep(10)
+        on_event.done.wait(10)
     assert len(on_event.received) == 6
-    for ed in on_event.received:
-        assert ed.correlation_id == message_id_base
-        assert message_id_base in ed.message_id
-        assert ed.content_type == "text/plain"
-        assert ed.properties[b"raw_prop"] == b"raw_value"
+    assert all(ed.correlation_id == message_id_base for ed in on_event.received)
+    assert all(ed.message_id.startswith(message_id_base) for ed in on_event.received)
+    assert {ed.content_type for ed in on_event.received} == {"text/plain"}
+    assert all(ed.properties[b"raw_prop"] == b"raw_value" for ed in on_event.received)
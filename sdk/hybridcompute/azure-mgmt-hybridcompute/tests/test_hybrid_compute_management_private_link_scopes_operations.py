@@ -0,0 +1,66 @@
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------
+import itertools
+
+import pytest
+from azure.mgmt.hybridcompute import HybridComputeManagementClient
+
+from devtools_testutils import AzureMgmtRecordedTestCase, RandomNameResourceGroupPreparer, recorded_by_proxy
+
+AZURE_LOCATION = "eastus"
+
+
+@pytest.mark.live_test_only
+class TestHybridComputeManagementPrivateLinkScopesOperations(AzureMgmtRecordedTestCase):
+    def setup_method(self, method):
+        self.client = self.create_mgmt_client(HybridComputeManagementClient)
+
+    # every operation runs against one scope in one resource group, so the group is provisioned only once
+    @RandomNameResourceGroupPreparer(location=AZURE_LOCATION)
+    @recorded_by_proxy
+    def test_private_link_scopes_lifecycle(self, resource_group):
+        scope_name = self.get_resource_name("scope")
+
+        scope = self.client.private_link_scopes.create_or_update(
+            resource_group_name=resource_group.name,
+            scope_name=scope_name,
+            parameters={"location": AZURE_LOCATION, "properties": {"publicNetworkAccess": "Disabled"}},
+        )
+        assert scope.name == scope_name
+
+        scope = self.client.private_link_scopes.get(
+            resource_group_name=resource_group.name,
+            scope_name=scope_name,
+        )
+        assert scope.name == scope_name
+
+        scope = self.client.private_link_scopes.update_tags(
+            resource_group_name=resource_group.name,
+            scope_name=scope_name,
+            private_link_scope_tags={"tags": {"str": "str"}},
+        )
+        assert scope.tags == {"str": "str"}
+
+        response = self.client.private_link_scopes.list_by_resource_group(
+            resource_group_name=resource_group.name,
+        )
+        # the resource group is new, so the first page holds our scope; don't page through anything more
+        result = list(itertools.islice(response, 5))
+        assert scope_name in [r.name for r in result]
+
+        response = self.client.private_link_scopes.list()
+        assert next(iter(response), None) is not None
+
+        details = self.client.private_link_scopes.get_validation_details(
+            location=AZURE_LOCATION,
+            private_link_scope_id=scope.properties.private_link_scope_id,
+        )
+        assert details.public_network_access == "Disabled"
+
+        self.client.private_link_scopes.begin_delete(
+            resource_group_name=resource_group.name,
+            scope_name=scope_name,
+        ).result()
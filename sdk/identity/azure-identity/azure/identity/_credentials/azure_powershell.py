@@ -4,15 +4,18 @@
 # ------------------------------------
 import base64
 import logging
+import shutil
 import subprocess
-import sys
-from typing import Any, List, Tuple, Optional
+import threading
+import time
+from typing import Any, Dict, List, Tuple, Optional
 
 from azure.core.credentials import AccessToken
 from azure.core.exceptions import ClientAuthenticationError
 
 from .azure_cli import get_safe_working_dir
 from .. import CredentialUnavailableError
+from .._constants import DEFAULT_REFRESH_OFFSET
 from .._internal import _scopes_to_resource, resolve_tenant, within_dac, validate_tenant_id, validate_scope
 from .._internal.decorators import log_get_token
 
@@ -39,6 +42,13 @@ $token = Get-AzAccessToken -ResourceUrl '{}'{}
 Write-Output "`nazsdk%$($token.Token)%$($token.ExpiresOn.ToUnixTimeSeconds())`n"
 """
 
+# SCRIPT is UTF-16-LE encoded once, with placeholders at known offsets which get_command_line overwrites
+_RESOURCE_PLACEHOLDER = "\0resource\0".encode("utf-16-le")
+_TENANT_PLACEHOLDER = "\0tenant\0".encode("utf-16-le")
+_ENCODED_SCRIPT = SCRIPT.format(NO_AZ_ACCOUNT_MODULE, "\0resource\0", "\0tenant\0").encode("utf-16-le")
+_RESOURCE_OFFSET = _ENCODED_SCRIPT.find(_RESOURCE_PLACEHOLDER)
+_TENANT_OFFSET = _ENCODED_SCRIPT.find(_TENANT_PLACEHOLDER)
+
 
 class AzurePowerShellCredential:
     """Authenticates by requesting a token from Azure PowerShell.
@@ -73,6 +83,9 @@ class AzurePowerShellCredential:
         self.tenant_id = tenant_id
         self._additionally_allowed_tenants = additionally_allowed_tenants or []
         self._process_timeout = process_timeout
+        self._cache: Dict[Tuple[Tuple[str, ...], Optional[str]], AccessToken] = {}
+        self._powershell_path: Optional[str] = None
+        self._powershell_probed = False
 
     def __enter__(self) -> "AzurePowerShellCredential":
         return self
@@ -93,8 +106,8 @@ class AzurePowerShellCredential:
     ) -> AccessToken:
         """Request an access token for `scopes`.
 
-        This method is called automatically by Azure SDK clients. Applications calling this method directly must
-        also handle token caching because this credential doesn't cache the tokens it acquires.
+        This method is called automatically by Azure SDK clients. Tokens are cached in memory per scope and tenant
+        until they're within five minutes of expiring.
 
         :param str scopes: desired scope for the access token. This credential allows only one scope per request.
             For more information about scopes, see
@@ -110,6 +123,16 @@ class AzurePowerShellCredential:
         :raises ~azure.core.exceptions.ClientAuthenticationError: the credential invoked Azure PowerShell but didn't
           receive an access token
         """
+        # hot path: a cached token needs no validation and no PowerShell process
+        token = self._cache.get((scopes, tenant_id))
+        if token is not None and token.expires_on - time.time() > DEFAULT_REFRESH_OFFSET:
+            return token
+
+        token = self._request_token(*scopes, tenant_id=tenant_id, **kwargs)
+        self._cache[(scopes, tenant_id)] = token
+        return token
+
+    def _request_token(self, *scopes: str, tenant_id: Optional[str] = None, **kwargs: Any) -> AccessToken:
         if tenant_id:
             validate_tenant_id(tenant_id)
         for scope in scopes:
@@ -121,28 +144,40 @@ class AzurePowerShellCredential:
             additionally_allowed_tenants=self._additionally_allowed_tenants,
             **kwargs,
         )
-        command_line = get_command_line(scopes, tenant_id)
+        if not self._powershell_probed:
+            self._powershell_path = find_powershell()
+            self._powershell_probed = True
+        if not self._powershell_path:
+            raise CredentialUnavailableError(message=POWERSHELL_NOT_INSTALLED)
+
+        command_line = get_command_line(scopes, tenant_id, self._powershell_path)
         output = run_command_line(command_line, self._process_timeout)
         token = parse_token(output)
         return token
 
 
+def find_powershell() -> Optional[str]:
+    """Locate PowerShell on the PATH without starting a process.
+
+    :return: the absolute path of pwsh, or of powershell when pwsh isn't installed; None when neither is found
+    :rtype: str or None
+    """
+    return shutil.which("pwsh") or shutil.which("powershell")
+
+
 def run_command_line(command_line: List[str], timeout: int) -> str:
     stdout = stderr = ""
     proc = None
-    kwargs = {"timeout": timeout}
+    token_written = False
 
     try:
-        proc = start_process(command_line)
-        stdout, stderr = proc.communicate(**kwargs)
-        if sys.platform.startswith("win") and ("' is not recognized" in stderr or proc.returncode == 9009):
-            # pwsh.exe isn't on the path; try powershell.exe
-            command_line[-1] = command_line[-1].replace("pwsh", "powershell", 1)
-            proc = start_process(command_line)
-            stdout, stderr = proc.communicate(**kwargs)
+        proc = start_powershell(command_line)
+        stdout, stderr, token_written = read_output(proc, timeout)
 
+    except CredentialUnavailableError:
+        raise
     except Exception as ex:  # pylint:disable=broad-except
-        # failed to execute "cmd" or "/bin/sh", or timed out; PowerShell and Az.Account may or may not be installed
+        # failed to execute PowerShell, or timed out; PowerShell and Az.Account may or may not be installed
         # (handling Exception here because subprocess.SubprocessError and .TimeoutExpired were added in 3.3)
         if proc and not proc.returncode:
             proc.kill()
@@ -153,10 +188,80 @@ def run_command_line(command_line: List[str], timeout: int) -> str:
         )
         raise error from ex
 
-    raise_for_error(proc.returncode, stdout, stderr)
+    if not token_written:
+        raise_for_error(proc.returncode, stdout, stderr)
     return stdout
 
 
+def read_output(proc: "subprocess.Popen", timeout: int) -> Tuple[str, str, bool]:
+    """Read PowerShell's output, stopping the process as soon as it writes the token.
+
+    Az.Accounts may keep writing warnings after the token, so rather than waiting for PowerShell to exit, this
+    terminates it once a line beginning with "azsdk%" appears on stdout. stderr is drained on a background thread so
+    a chatty process can't block on a full pipe.
+
+    :param proc: the PowerShell process
+    :type proc: ~subprocess.Popen
+    :param int timeout: seconds to wait for the token or for the process to exit
+    :return: stdout, stderr, and whether stdout contained the token line
+    :rtype: tuple[str, str, bool]
+    :raises ~subprocess.TimeoutExpired: PowerShell neither wrote the token nor exited within `timeout` seconds
+    """
+    deadline = time.monotonic() + timeout
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    stderr_chunks: List[str] = []
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    stderr_reader.start()
+    # reading stdout blocks, so a timer enforces the timeout by killing the process, which closes its pipes
+    watchdog = threading.Timer(timeout, kill)
+    watchdog.start()
+
+    lines = []
+    token_written = False
+    try:
+        for line in proc.stdout:
+            lines.append(line)
+            if line.startswith("azsdk%"):
+                token_written = True
+                proc.terminate()
+                break
+        try:
+            proc.wait(max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            # once the token is written, PowerShell being slow to exit doesn't matter
+            if not token_written:
+                raise
+    finally:
+        watchdog.cancel()
+    # the watchdog may fire after the token is written, before it's cancelled; the token still stands
+    if timed_out.is_set() and not token_written:
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+
+    # once the token is written, stderr only matters for debugging; don't wait long for it
+    stderr_reader.join(1 if token_written else max(deadline - time.monotonic(), 0))
+    return "".join(lines), "".join(stderr_chunks), token_written
+
+
+def start_powershell(command_line: List[str]) -> "subprocess.Popen":
+    # PowerShell is launched directly, so a missing executable surfaces as FileNotFoundError
+    try:
+        return start_process(command_line)
+    except FileNotFoundError:
+        pass
+
+    # pwsh isn't on the path; try Windows PowerShell
+    command_line[0] = "powershell"
+    try:
+        return start_process(command_line)
+    except FileNotFoundError as ex:
+        raise CredentialUnavailableError(message=POWERSHELL_NOT_INSTALLED) from ex
+
+
 def start_process(args: List[str]) -> "subprocess.Popen":
     working_directory = get_safe_working_dir()
     proc = subprocess.Popen(  # pylint:disable=consider-using-with
@@ -181,19 +286,19 @@ def parse_token(output: str) -> AccessToken:
     raise ClientAuthenticationError(message='Unexpected output from Get-AzAccessToken: "{}"'.format(output))
 
 
-def get_command_line(scopes: Tuple[str, ...], tenant_id: str) -> List[str]:
+def get_command_line(scopes: Tuple[str, ...], tenant_id: str, executable: str = "pwsh") -> List[str]:
     if tenant_id:
         tenant_argument = " -TenantId " + tenant_id
     else:
         tenant_argument = ""
     resource = _scopes_to_resource(*scopes)
-    script = SCRIPT.format(NO_AZ_ACCOUNT_MODULE, resource, tenant_argument)
-    encoded_script = base64.b64encode(script.encode("utf-16-le")).decode()
+    script = bytearray(_ENCODED_SCRIPT)
+    # the tenant placeholder follows the resource placeholder, so replacing it first leaves _RESOURCE_OFFSET valid
+    script[_TENANT_OFFSET : _TENANT_OFFSET + len(_TENANT_PLACEHOLDER)] = tenant_argument.encode("utf-16-le")
+    script[_RESOURCE_OFFSET : _RESOURCE_OFFSET + len(_RESOURCE_PLACEHOLDER)] = resource.encode("utf-16-le")
+    encoded_script = base64.b64encode(script).decode()
 
-    command = "pwsh -NoProfile -NonInteractive -EncodedCommand " + encoded_script
-    if sys.platform.startswith("win"):
-        return ["cmd", "/c", command + " & exit"]
-    return ["/bin/sh", "-c", command]
+    return [executable, "-NoProfile", "-NonInteractive", "-EncodedCommand", encoded_script]
 
 
 def raise_for_error(return_code: int, stdout: str, stderr: str) -> None:
@@ -202,7 +307,7 @@ def raise_for_error(return_code: int, stdout: str, stderr: str) -> None:
             raise CredentialUnavailableError(AZ_ACCOUNT_NOT_INSTALLED)
         return
 
-    if return_code == 127 or "' is not recognized" in stderr:
+    if return_code == 127:
         raise CredentialUnavailableError(message=POWERSHELL_NOT_INSTALLED)
     if "Run Connect-AzAccount to login" in stderr:
         raise CredentialUnavailableError(message=RUN_CONNECT_AZ_ACCOUNT)
@@ -2,11 +2,19 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import functools
 import os
-from typing import Any, Optional, Dict
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Optional, Dict, Tuple
+from urllib.parse import urlparse
 
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
-from azure.core.pipeline.transport import HttpRequest
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+from azure.core.pipeline.transport import HttpRequest, HttpTransport
 from azure.core.credentials import AccessToken
 
 from .. import CredentialUnavailableError
@@ -18,6 +26,8 @@ from .._internal.managed_identity_client import ManagedIdentityClient
 
 IMDS_AUTHORITY = "http://169.254.169.254"
 IMDS_TOKEN_PATH = "/metadata/identity/oauth2/token"
+NO_RESPONSE_MESSAGE = "ManagedIdentityCredential authentication unavailable, no response from the IMDS endpoint."
+_STATIC_PARAMS = (("api-version", "2018-02-01"),)
 
 PIPELINE_SETTINGS = {
     "connection_timeout": 2,
@@ -29,17 +39,91 @@ PIPELINE_SETTINGS = {
     "retry_total": 5,
 }
 
+# The token request sent alongside the availability probe (see ImdsCredential._probe_and_request_token) has a short
+# timeout and no retries, so it can't outlive a failed probe by much.
+PROBE_REQUEST_SETTINGS = {"connection_timeout": 1, "retry_total": 0}
 
-def _get_request(scope: str, identity_config: Dict) -> HttpRequest:
-    url = (
-        os.environ.get(EnvironmentVariables.AZURE_POD_IDENTITY_AUTHORITY_HOST, IMDS_AUTHORITY).strip("/")
-        + IMDS_TOKEN_PATH
+
+# requests session shared by every ImdsCredential which isn't given a transport, so they share a connection pool
+_SHARED_SESSION: Any = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def _get_shared_transport(**kwargs: Any) -> HttpTransport:
+    from azure.core.pipeline.transport import (  # pylint: disable=non-abstract-transport-import, no-name-in-module
+        RequestsTransport,
     )
+
+    global _SHARED_SESSION  # pylint:disable=global-statement
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            # opening a transport creates and configures a session, which then outlives that transport
+            transport = RequestsTransport(**kwargs)
+            transport.open()
+            _SHARED_SESSION = transport.session
+
+    # the transport doesn't own the session, so closing a credential leaves the session open for the others
+    return RequestsTransport(session=_SHARED_SESSION, session_owner=False, **kwargs)
+
+
+def _get_imds_url() -> str:
+    authority = os.environ.get(EnvironmentVariables.AZURE_POD_IDENTITY_AUTHORITY_HOST, IMDS_AUTHORITY)
+    return authority.rstrip("/") + IMDS_TOKEN_PATH
+
+
+def _get_request(url: str, scope: str, identity_config: Dict) -> HttpRequest:
     request = HttpRequest("GET", url)
-    request.format_parameters(dict({"api-version": "2018-02-01", "resource": scope}, **identity_config))
+    params = dict(_STATIC_PARAMS)
+    params["resource"] = scope
+    params.update(identity_config)
+    request.format_parameters(params)
     return request
 
 
+def _get_imds_address() -> Tuple[str, int]:
+    authority = urlparse(os.environ.get(EnvironmentVariables.AZURE_POD_IDENTITY_AUTHORITY_HOST, IMDS_AUTHORITY))
+    return authority.hostname or "169.254.169.254", authority.port or 80
+
+
+def _probe_imds(address: Tuple[str, int], timeout: float = 1.0) -> bool:
+    """Check whether anything is listening at the IMDS address, without sending a request.
+
+    :param address: host and port of the IMDS endpoint
+    :type address: tuple[str, int]
+    :param float timeout: seconds to wait for the connection
+    :return: whether a TCP connection to the endpoint succeeded
+    :rtype: bool
+    """
+    try:
+        with socket.create_connection(address, timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+# Process-wide probe results keyed by IMDS address. A success holds for the life of the process; a failure holds for
+# PROBE_FAILURE_TTL seconds, so credentials created in the meantime don't each wait out another probe timeout.
+PROBE_FAILURE_TTL = 60
+_PROBE_RESULTS: Dict[Tuple[str, int], Tuple[bool, float]] = {}
+_PROBE_RESULTS_LOCK = threading.Lock()
+
+
+def _get_cached_probe_result(address: Tuple[str, int]) -> Optional[bool]:
+    with _PROBE_RESULTS_LOCK:
+        result = _PROBE_RESULTS.get(address)
+    if result is None:
+        return None
+    available, expires_on = result
+    if not available and time.monotonic() >= expires_on:
+        return None
+    return available
+
+
+def _cache_probe_result(address: Tuple[str, int], available: bool) -> None:
+    with _PROBE_RESULTS_LOCK:
+        _PROBE_RESULTS[address] = (available, time.monotonic() + PROBE_FAILURE_TTL)
+
+
 def _check_forbidden_response(ex: HttpResponseError) -> None:
     """Special case handling for Docker Desktop.
 
@@ -50,21 +134,83 @@ def _check_forbidden_response(ex: HttpResponseError) -> None:
     :raises ~azure.core.exceptions.CredentialUnavailableError: When the IMDS endpoint is unreachable
     """
     if ex.status_code == 403:
-        if ex.message and "unreachable" in ex.message:
+        # search the raw body where there is one, rather than the message decoded from it
+        if ex.response is not None:
+            unreachable = b"unreachable" in (ex.response.body() or b"")
+        else:
+            unreachable = bool(ex.message) and "unreachable" in ex.message
+        if unreachable:
             error_message = f"ManagedIdentityCredential authentication unavailable. Error: {ex.message}"
-            raise CredentialUnavailableError(message=error_message) from ex
+            # the message carries the response; the HttpResponseError adds nothing but its frames
+            raise CredentialUnavailableError(message=error_message) from None
+
+
+def _no_identity_message(user_assigned_identity: bool, error: Optional[str]) -> str:
+    error_message = "ManagedIdentityCredential authentication unavailable. "
+    if user_assigned_identity:
+        error_message += "The requested identity has not been assigned to this resource."
+    else:
+        error_message += "No identity has been assigned to this resource."
+
+    if error:
+        error_message += f" Error: {error}"
+    return error_message
+
+
+def _check_no_identity_response(ex: HttpResponseError, user_assigned_identity: bool) -> None:
+    """Raises CredentialUnavailableError for a 400 ImdsResponsePolicy didn't see.
+
+    ImdsResponsePolicy handles 400 responses as they arrive, but isn't in the pipeline when the credential is given
+    its own ``policies``.
+
+    :param ~azure.core.exceptions.HttpResponseError ex: The exception raised by the request
+    :param bool user_assigned_identity: whether the credential requests a user-assigned identity
+    :raises ~azure.core.exceptions.CredentialUnavailableError: When IMDS responded 400
+    """
+    if ex.status_code == 400:
+        raise CredentialUnavailableError(message=_no_identity_message(user_assigned_identity, ex.message)) from ex
+
+
+class ImdsResponsePolicy(SansIOHTTPPolicy):
+    """Raises CredentialUnavailableError when IMDS responds 400.
+
+    A 400 in response to a token request indicates managed identity is disabled, or the identity with the specified
+    client_id is not available. Raising here, once, spares the credential from catching the error the client would
+    raise for the response and chaining another exception onto it.
+
+    :param bool user_assigned_identity: whether the credential requests a user-assigned identity
+    """
+
+    def __init__(self, user_assigned_identity: bool) -> None:
+        self._user_assigned_identity = user_assigned_identity
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        http_response = response.http_response
+        if http_response.status_code != 400:
+            return
+
+        error_message = _no_identity_message(self._user_assigned_identity, http_response.text())
+        raise CredentialUnavailableError(message=error_message, response=http_response)
 
 
 class ImdsCredential(GetTokenMixin):
     def __init__(self, **kwargs: Any) -> None:
         super(ImdsCredential, self).__init__()
 
-        self._client = ManagedIdentityClient(_get_request, **dict(PIPELINE_SETTINGS, **kwargs))
+        self._user_assigned_identity = "client_id" in kwargs or "identity_config" in kwargs
+        settings = dict(PIPELINE_SETTINGS, **kwargs)
+        if "transport" not in settings:
+            settings["transport"] = _get_shared_transport(**settings)
+        self._client = ManagedIdentityClient(
+            functools.partial(_get_request, _get_imds_url()),
+            _per_retry_policies=[ImdsResponsePolicy(self._user_assigned_identity)],
+            **settings,
+        )
         if EnvironmentVariables.AZURE_POD_IDENTITY_AUTHORITY_HOST in os.environ:
             self._endpoint_available: Optional[bool] = True
         else:
             self._endpoint_available = None
-        self._user_assigned_identity = "client_id" in kwargs or "identity_config" in kwargs
+        self._imds_address = _get_imds_address()
 
     def __enter__(self) -> "ImdsCredential":
         self._client.__enter__()
@@ -83,45 +229,75 @@ class ImdsCredential(GetTokenMixin):
 
         if within_credential_chain.get() and not self._endpoint_available:
             # If within a chain (e.g. DefaultAzureCredential), we do a quick check to see if the IMDS endpoint
-            # is available to avoid hanging for a long time if the endpoint isn't available.
+            # is available to avoid hanging for a long time if the endpoint isn't available. Connecting a socket
+            # is enough to tell; a proxy answering for an unreachable endpoint is handled with the token response.
+            available = _get_cached_probe_result(self._imds_address)
+            if available is None:
+                return self._probe_and_request_token(*scopes)
+            self._endpoint_available = available
+            if not available:
+                raise CredentialUnavailableError(NO_RESPONSE_MESSAGE)
+
+        return self._request_imds_token(*scopes)
+
+    def _probe_and_request_token(self, *scopes: str) -> AccessToken:
+        # Probe and request a token concurrently, so a present IMDS doesn't add the probe's latency to the request.
+        # A failed probe abandons the request. Interpreter exit joins the executor's threads, so that request mustn't
+        # be one which retries: it's sent with PROBE_REQUEST_SETTINGS, and a retried request follows only once IMDS
+        # is known to be available.
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            probe = executor.submit(_probe_imds, self._imds_address)
+            token_request = executor.submit(
+                self._client.request_token, *scopes, headers={"Metadata": "true"}, **PROBE_REQUEST_SETTINGS
+            )
+            done, _ = wait((probe, token_request), return_when=FIRST_COMPLETED)
+            if token_request not in done:
+                self._record_probe_result(probe.result())
+
             try:
-                self._client.request_token(*scopes, connection_timeout=1, retry_total=0)
-                self._endpoint_available = True
+                return self._record_token(token_request.result())
+            except CredentialUnavailableError:
+                # IMDS has no identity for this resource (see ImdsResponsePolicy), or the response is not json
+                raise
             except HttpResponseError as ex:
-                # IMDS responded
+                # IMDS responded, though perhaps with an error the retried request below will get past
                 _check_forbidden_response(ex)
-                self._endpoint_available = True
-            except Exception as ex:  # pylint:disable=broad-except
-                error_message = (
-                    "ManagedIdentityCredential authentication unavailable, no response from the IMDS endpoint."
-                )
-                raise CredentialUnavailableError(error_message) from ex
+                self._record_probe_result(True)
+                _check_no_identity_response(ex, self._user_assigned_identity)
+            except Exception:  # pylint:disable=broad-except
+                # the request failed without a response; whether IMDS is there at all is up to the probe
+                self._record_probe_result(probe.result())
+        finally:
+            executor.shutdown(wait=False)
+
+        return self._record_token(self._request_imds_token(*scopes))
 
+    def _record_probe_result(self, available: bool) -> None:
+        _cache_probe_result(self._imds_address, available)
+        self._endpoint_available = available
+        if not available:
+            raise CredentialUnavailableError(NO_RESPONSE_MESSAGE)
+
+    def _record_token(self, token: AccessToken) -> AccessToken:
+        # a token is as good as a successful probe
+        _cache_probe_result(self._imds_address, True)
+        self._endpoint_available = True
+        return token
+
+    def _request_imds_token(self, *scopes: str) -> AccessToken:
         try:
             token = self._client.request_token(*scopes, headers={"Metadata": "true"})
         except CredentialUnavailableError:
-            # Response is not json, skip the IMDS credential
+            # IMDS has no identity for this resource (see ImdsResponsePolicy), or the response is not json;
+            # skip the IMDS credential
             raise
         except HttpResponseError as ex:
-            # 400 in response to a token request indicates managed identity is disabled,
-            # or the identity with the specified client_id is not available
-            if ex.status_code == 400:
-                error_message = "ManagedIdentityCredential authentication unavailable. "
-                if self._user_assigned_identity:
-                    error_message += "The requested identity has not been assigned to this resource."
-                else:
-                    error_message += "No identity has been assigned to this resource."
-
-                if ex.message:
-                    error_message += f" Error: {ex.message}"
-
-                raise CredentialUnavailableError(message=error_message) from ex
-
             _check_forbidden_response(ex)
+            _check_no_identity_response(ex, self._user_assigned_identity)
             # any other error is unexpected
             raise ClientAuthenticationError(message=ex.message, response=ex.response) from ex
         except Exception as ex:  # pylint:disable=broad-except
             # if anything else was raised, assume the endpoint is unavailable
-            error_message = "ManagedIdentityCredential authentication unavailable, no response from the IMDS endpoint."
-            raise CredentialUnavailableError(error_message) from ex
+            raise CredentialUnavailableError(NO_RESPONSE_MESSAGE) from ex
         return token
@@ -4,14 +4,18 @@
 # ------------------------------------
 import asyncio
 import sys
-from typing import Any, cast, List, Optional
+import time
+from typing import Any, cast, Dict, List, Optional, Tuple
 from azure.core.credentials import AccessToken
 
 from .._internal import AsyncContextManager
 from .._internal.decorators import log_get_token_async
 from ... import CredentialUnavailableError
+from ..._constants import DEFAULT_REFRESH_OFFSET
 from ..._credentials.azure_powershell import (
     AzurePowerShellCredential as _SyncCredential,
+    POWERSHELL_NOT_INSTALLED,
+    find_powershell,
     get_command_line,
     get_safe_working_dir,
     raise_for_error,
@@ -53,6 +57,9 @@ class AzurePowerShellCredential(AsyncContextManager):
         self.tenant_id = tenant_id
         self._additionally_allowed_tenants = additionally_allowed_tenants or []
         self._process_timeout = process_timeout
+        self._cache: Dict[Tuple[Tuple[str, ...], Optional[str]], AccessToken] = {}
+        self._powershell_path: Optional[str] = None
+        self._powershell_probed = False
 
     @log_get_token_async
     async def get_token(
@@ -64,8 +71,8 @@ class AzurePowerShellCredential(AsyncContextManager):
     ) -> AccessToken:
         """Request an access token for `scopes`.
 
-        This method is called automatically by Azure SDK clients. Applications calling this method directly must
-        also handle token caching because this credential doesn't cache the tokens it acquires.
+        This method is called automatically by Azure SDK clients. Tokens are cached in memory per scope and tenant
+        until they're within five minutes of expiring.
 
         :param str scopes: desired scope for the access token. This credential allows only one scope per request.
             For more information about scopes, see
@@ -80,6 +87,16 @@ class AzurePowerShellCredential(AsyncContextManager):
         :raises ~azure.core.exceptions.ClientAuthenticationError: the credential invoked Azure PowerShell but didn't
           receive an access token
         """
+        # hot path: a cached token needs no validation and no PowerShell process
+        token = self._cache.get((scopes, tenant_id))
+        if token is not None and token.expires_on - time.time() > DEFAULT_REFRESH_OFFSET:
+            return token
+
+        token = await self._request_token(*scopes, tenant_id=tenant_id, **kwargs)
+        self._cache[(scopes, tenant_id)] = token
+        return token
+
+    async def _request_token(self, *scopes: str, tenant_id: Optional[str] = None, **kwargs: Any) -> AccessToken:
         # only ProactorEventLoop supports subprocesses on Windows (and it isn't the default loop on Python < 3.8)
         if sys.platform.startswith("win") and not isinstance(asyncio.get_event_loop(), asyncio.ProactorEventLoop):
             return _SyncCredential().get_token(*scopes, tenant_id=tenant_id, **kwargs)
@@ -95,7 +112,13 @@ class AzurePowerShellCredential(AsyncContextManager):
             additionally_allowed_tenants=self._additionally_allowed_tenants,
             **kwargs,
         )
-        command_line = get_command_line(scopes, tenant_id)
+        if not self._powershell_probed:
+            self._powershell_path = find_powershell()
+            self._powershell_probed = True
+        if not self._powershell_path:
+            raise CredentialUnavailableError(message=POWERSHELL_NOT_INSTALLED)
+
+        command_line = get_command_line(scopes, tenant_id, self._powershell_path)
         output = await run_command_line(command_line, self._process_timeout)
         token = parse_token(output)
         return token
@@ -106,13 +129,8 @@ class AzurePowerShellCredential(AsyncContextManager):
 
 async def run_command_line(command_line: List[str], timeout: int) -> str:
     try:
-        proc = await start_process(command_line)
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), 10)
-        if sys.platform.startswith("win") and (b"' is not recognized" in stderr or proc.returncode == 9009):
-            # pwsh.exe isn't on the path; try powershell.exe
-            command_line[-1] = command_line[-1].replace("pwsh", "powershell", 1)
-            proc = await start_process(command_line)
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        proc = await start_powershell(command_line)
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
 
     except asyncio.TimeoutError as ex:
         proc.kill()
@@ -122,7 +140,7 @@ async def run_command_line(command_line: List[str], timeout: int) -> str:
             "https://aka.ms/azsdk/python/identity/powershellcredential/troubleshoot."
         ) from ex
     except OSError as ex:
-        # failed to execute "cmd" or "/bin/sh"; Azure PowerShell may or may not be installed
+        # failed to execute PowerShell; it may or may not be installed
         error = CredentialUnavailableError(
             message='Failed to execute "{}".\n'
             "To mitigate this issue, please refer to the troubleshooting guidelines here at "
@@ -138,6 +156,21 @@ async def run_command_line(command_line: List[str], timeout: int) -> str:
     return decoded_stdout
 
 
+async def start_powershell(command_line: List[str]) -> "asyncio.subprocess.Process":
+    # PowerShell is launched directly, so a missing executable surfaces as FileNotFoundError
+    try:
+        return await start_process(command_line)
+    except FileNotFoundError:
+        pass
+
+    # pwsh isn't on the path; try Windows PowerShell
+    command_line[0] = "powershell"
+    try:
+        return await start_process(command_line)
+    except FileNotFoundError as ex:
+        raise CredentialUnavailableError(message=POWERSHELL_NOT_INSTALLED) from ex
+
+
 async def start_process(command_line):
     working_directory = get_safe_working_dir()
     proc = await asyncio.create_subprocess_exec(
@@ -2,8 +2,10 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
+import functools
 import os
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
 from azure.core.credentials import AccessToken
@@ -13,19 +15,45 @@ from .._internal import AsyncContextManager
 from .._internal.get_token_mixin import GetTokenMixin
 from .._internal.managed_identity_client import AsyncManagedIdentityClient
 from ..._internal import within_credential_chain
-from ..._credentials.imds import _get_request, _check_forbidden_response, PIPELINE_SETTINGS
+from ..._credentials.imds import (
+    _get_request,
+    _get_imds_address,
+    _get_imds_url,
+    _get_cached_probe_result,
+    _cache_probe_result,
+    _check_forbidden_response,
+    _check_no_identity_response,
+    ImdsResponsePolicy,
+    PIPELINE_SETTINGS,
+    PROBE_REQUEST_SETTINGS,
+    NO_RESPONSE_MESSAGE,
+)
+
+
+async def _probe_imds(address: Tuple[str, int], timeout: float = 1.0) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(*address), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
 
 
 class ImdsCredential(AsyncContextManager, GetTokenMixin):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__()
 
-        self._client = AsyncManagedIdentityClient(_get_request, **dict(PIPELINE_SETTINGS, **kwargs))
+        self._user_assigned_identity = "client_id" in kwargs or "identity_config" in kwargs
+        self._client = AsyncManagedIdentityClient(
+            functools.partial(_get_request, _get_imds_url()),
+            _per_retry_policies=[ImdsResponsePolicy(self._user_assigned_identity)],
+            **dict(PIPELINE_SETTINGS, **kwargs),
+        )
         if EnvironmentVariables.AZURE_POD_IDENTITY_AUTHORITY_HOST in os.environ:
             self._endpoint_available: Optional[bool] = True
         else:
             self._endpoint_available = None
-        self._user_assigned_identity = "client_id" in kwargs or "identity_config" in kwargs
+        self._imds_address = _get_imds_address()
 
     async def __aenter__(self) -> "ImdsCredential":
         await self._client.__aenter__()
@@ -41,45 +69,74 @@ class ImdsCredential(AsyncContextManager, GetTokenMixin):
 
         if within_credential_chain.get() and not self._endpoint_available:
             # If within a chain (e.g. DefaultAzureCredential), we do a quick check to see if the IMDS endpoint
-            # is available to avoid hanging for a long time if the endpoint isn't available.
+            # is available to avoid hanging for a long time if the endpoint isn't available. Connecting a socket
+            # is enough to tell; a proxy answering for an unreachable endpoint is handled with the token response.
+            available = _get_cached_probe_result(self._imds_address)
+            if available is None:
+                return await self._probe_and_request_token(*scopes)
+            self._endpoint_available = available
+            if not available:
+                raise CredentialUnavailableError(message=NO_RESPONSE_MESSAGE)
+
+        return await self._request_imds_token(*scopes)
+
+    async def _probe_and_request_token(self, *scopes: str) -> AccessToken:
+        # Probe and request a token concurrently, so a present IMDS doesn't add the probe's latency to the request.
+        # A failed probe cancels the request. The request is sent with PROBE_REQUEST_SETTINGS, so it doesn't stand in
+        # for one which retries: that follows once IMDS is known to be available, to ride out identity provisioning.
+        probe = asyncio.ensure_future(_probe_imds(self._imds_address))
+        token_request = asyncio.ensure_future(
+            self._client.request_token(*scopes, headers={"Metadata": "true"}, **PROBE_REQUEST_SETTINGS)
+        )
+        try:
+            done, _ = await asyncio.wait((probe, token_request), return_when=asyncio.FIRST_COMPLETED)
+            if token_request not in done:
+                self._record_probe_result(probe.result())
+
             try:
-                await self._client.request_token(*scopes, connection_timeout=1, retry_total=0)
-                self._endpoint_available = True
+                return self._record_token(await token_request)
+            except CredentialUnavailableError:
+                # IMDS has no identity for this resource (see ImdsResponsePolicy), or the response is not json
+                raise
             except HttpResponseError as ex:
-                # IMDS responded
+                # IMDS responded, though perhaps with an error the retried request below will get past
                 _check_forbidden_response(ex)
-                self._endpoint_available = True
-            except Exception as ex:  # pylint:disable=broad-except
-                error_message = (
-                    "ManagedIdentityCredential authentication unavailable, no response from the IMDS endpoint."
-                )
-                raise CredentialUnavailableError(message=error_message) from ex
+                self._record_probe_result(True)
+                _check_no_identity_response(ex, self._user_assigned_identity)
+            except Exception:  # pylint:disable=broad-except
+                # the request failed without a response; whether IMDS is there at all is up to the probe
+                self._record_probe_result(await probe)
+        finally:
+            probe.cancel()
+            token_request.cancel()
 
+        return self._record_token(await self._request_imds_token(*scopes))
+
+    def _record_probe_result(self, available: bool) -> None:
+        _cache_probe_result(self._imds_address, available)
+        self._endpoint_available = available
+        if not available:
+            raise CredentialUnavailableError(message=NO_RESPONSE_MESSAGE)
+
+    def _record_token(self, token: AccessToken) -> AccessToken:
+        # a token is as good as a successful probe
+        _cache_probe_result(self._imds_address, True)
+        self._endpoint_available = True
+        return token
+
+    async def _request_imds_token(self, *scopes: str) -> AccessToken:
         try:
             token = await self._client.request_token(*scopes, headers={"Metadata": "true"})
         except CredentialUnavailableError:
-            # Response is not json, skip the IMDS credential
+            # IMDS has no identity for this resource (see ImdsResponsePolicy), or the response is not json;
+            # skip the IMDS credential
             raise
         except HttpResponseError as ex:
-            # 400 in response to a token request indicates managed identity is disabled,
-            # or the identity with the specified client_id is not available
-            if ex.status_code == 400:
-                error_message = "ManagedIdentityCredential authentication unavailable. "
-                if self._user_assigned_identity:
-                    error_message += "The requested identity has not been assigned to this resource."
-                else:
-                    error_message += "No identity has been assigned to this resource."
-
-                if ex.message:
-                    error_message += f" Error: {ex.message}"
-
-                raise CredentialUnavailableError(message=error_message) from ex
-
             _check_forbidden_response(ex)
+            _check_no_identity_response(ex, self._user_assigned_identity)
             # any other error is unexpected
             raise ClientAuthenticationError(message=ex.message, response=ex.response) from ex
         except Exception as ex:  # pylint:disable=broad-except
             # if anything else was raised, assume the endpoint is unavailable
-            error_message = "ManagedIdentityCredential authentication unavailable, no response from the IMDS endpoint."
-            raise CredentialUnavailableError(error_message) from ex
+            raise CredentialUnavailableError(NO_RESPONSE_MESSAGE) from ex
         return token
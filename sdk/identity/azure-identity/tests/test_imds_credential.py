@@ -0,0 +1,209 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import json
+import time
+from unittest import mock
+
+import pytest
+from azure.core.exceptions import ServiceRequestError
+from azure.core.pipeline.policies import HeadersPolicy
+from azure.identity import CredentialUnavailableError
+from azure.identity._credentials import imds
+from azure.identity._credentials.imds import ImdsCredential, ImdsResponsePolicy
+from azure.identity._internal import within_credential_chain
+
+SCOPE = "https://management.azure.com/.default"
+
+
+def mock_response(status_code=200, json_payload=None, text=""):
+    response = mock.Mock(status_code=status_code, headers={})
+    if json_payload is not None:
+        text = json.dumps(json_payload)
+        response.headers["content-type"] = "application/json"
+        response.content_type = "application/json"
+    else:
+        response.headers["content-type"] = "text/plain"
+        response.content_type = "text/plain"
+    response.text = lambda encoding=None: text
+    response.body = lambda: text.encode("utf-8")
+    return response
+
+
+def token_response(access_token="***"):
+    expires_on = int(time.time()) + 3600
+    return mock_response(
+        json_payload={
+            "access_token": access_token,
+            "expires_in": 3600,
+            "expires_on": expires_on,
+            "ext_expires_in": 3600,
+            "not_before": expires_on - 3600,
+            "resource": "https://management.azure.com",
+            "token_type": "Bearer",
+        }
+    )
+
+
+def unexpected_send(*_, **__):
+    raise AssertionError("the credential shouldn't send a request")
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_results():
+    """Keep probe results cached by one test from deciding another's"""
+    imds._PROBE_RESULTS.clear()
+    yield
+    imds._PROBE_RESULTS.clear()
+
+
+@pytest.fixture
+def in_credential_chain():
+    token = within_credential_chain.set(True)
+    yield
+    within_credential_chain.reset(token)
+
+
+@pytest.fixture
+def no_pod_identity(monkeypatch):
+    monkeypatch.delenv(imds.EnvironmentVariables.AZURE_POD_IDENTITY_AUTHORITY_HOST, raising=False)
+
+
+def test_cached_probe_failure(in_credential_chain, no_pod_identity):
+    """A cached probe failure makes the credential unavailable without probing or sending a request"""
+
+    imds._cache_probe_result(imds._get_imds_address(), False)
+    credential = ImdsCredential(transport=mock.Mock(send=unexpected_send))
+
+    with mock.patch(imds.__name__ + ".socket.create_connection") as create_connection:
+        with pytest.raises(CredentialUnavailableError):
+            credential.get_token(SCOPE)
+    assert create_connection.call_count == 0
+
+
+def test_cached_probe_failure_expires(in_credential_chain, no_pod_identity):
+    """Once a cached probe failure expires, the next credential probes again"""
+
+    with mock.patch(imds.__name__ + ".PROBE_FAILURE_TTL", 0):
+        imds._cache_probe_result(imds._get_imds_address(), False)
+    assert imds._get_cached_probe_result(imds._get_imds_address()) is None
+
+    transport = mock.Mock(send=mock.Mock(side_effect=ServiceRequestError("no response")))
+    credential = ImdsCredential(transport=transport)
+
+    with mock.patch(imds.__name__ + ".socket.create_connection", side_effect=OSError) as create_connection:
+        with pytest.raises(CredentialUnavailableError):
+            credential.get_token(SCOPE)
+    assert create_connection.call_count == 1
+
+    # the new failure is cached in turn
+    assert imds._get_cached_probe_result(imds._get_imds_address()) is False
+
+
+def test_cached_probe_success(in_credential_chain, no_pod_identity):
+    """A cached probe success lets the credential request a token without probing"""
+
+    imds._cache_probe_result(imds._get_imds_address(), True)
+    transport = mock.Mock(send=mock.Mock(return_value=token_response("token")))
+    credential = ImdsCredential(transport=transport)
+
+    with mock.patch(imds.__name__ + ".socket.create_connection") as create_connection:
+        token = credential.get_token(SCOPE)
+    assert token.token == "token"
+    assert create_connection.call_count == 0
+    assert transport.send.call_count == 1
+
+
+def test_probe_success_is_cached(in_credential_chain, no_pod_identity):
+    """A token from the first chained request is as good as a successful probe"""
+
+    transport = mock.Mock(send=mock.Mock(return_value=token_response("token")))
+    credential = ImdsCredential(transport=transport)
+
+    with mock.patch(imds.__name__ + ".socket.create_connection"):
+        token = credential.get_token(SCOPE)
+    assert token.token == "token"
+    assert imds._get_cached_probe_result(imds._get_imds_address()) is True
+
+
+@pytest.mark.parametrize(
+    "user_assigned_identity,expected_message",
+    (
+        (False, "No identity has been assigned to this resource."),
+        (True, "The requested identity has not been assigned to this resource."),
+    ),
+)
+def test_response_policy_400(user_assigned_identity, expected_message):
+    """IMDS responding 400 means the identity is unavailable"""
+
+    body = "Identity not found"
+    policy = ImdsResponsePolicy(user_assigned_identity)
+    response = mock.Mock(http_response=mock_response(status_code=400, text=body))
+
+    with pytest.raises(CredentialUnavailableError) as ex:
+        policy.on_response(mock.Mock(), response)
+    assert ex.value.message == (
+        "ManagedIdentityCredential authentication unavailable. " + expected_message + " Error: " + body
+    )
+
+
+@pytest.mark.parametrize("status_code", (200, 403, 410, 500))
+def test_response_policy_ignores_other_responses(status_code):
+    policy = ImdsResponsePolicy(user_assigned_identity=False)
+    response = mock.Mock(http_response=mock_response(status_code=status_code, text="..."))
+    policy.on_response(mock.Mock(), response)
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_message",
+    (
+        ({}, "No identity has been assigned to this resource."),
+        ({"client_id": "client-id"}, "The requested identity has not been assigned to this resource."),
+    ),
+)
+def test_400_response(kwargs, expected_message):
+    """The credential raises ImdsResponsePolicy's error for a 400, without retrying"""
+
+    transport = mock.Mock(send=mock.Mock(return_value=mock_response(status_code=400, text="...")))
+    credential = ImdsCredential(transport=transport, **kwargs)
+
+    with pytest.raises(CredentialUnavailableError) as ex:
+        credential.get_token(SCOPE)
+    assert expected_message in ex.value.message
+    assert transport.send.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_message",
+    (
+        ({}, "No identity has been assigned to this resource."),
+        ({"client_id": "client-id"}, "The requested identity has not been assigned to this resource."),
+    ),
+)
+def test_400_response_custom_policies(kwargs, expected_message):
+    """The credential handles a 400 itself when custom policies leave ImdsResponsePolicy out of the pipeline"""
+
+    error = {"error": "invalid_request", "error_description": "Identity not found"}
+    transport = mock.Mock(send=mock.Mock(return_value=mock_response(status_code=400, json_payload=error)))
+    credential = ImdsCredential(transport=transport, policies=[HeadersPolicy()], **kwargs)
+
+    with pytest.raises(CredentialUnavailableError) as ex:
+        credential.get_token(SCOPE)
+    assert expected_message in ex.value.message
+    assert transport.send.call_count == 1
+
+
+def test_chained_request_retries_once_imds_is_available(in_credential_chain, no_pod_identity):
+    """IMDS responding 410 while an identity is provisioned gets the full retry schedule, not the probe's request"""
+
+    gone = [mock_response(status_code=410, json_payload={"error": "identity not ready"}) for _ in range(4)]
+    transport = mock.Mock(send=mock.Mock(side_effect=gone + [token_response("token")]))
+    credential = ImdsCredential(transport=transport)
+
+    with mock.patch(imds.__name__ + ".socket.create_connection"):
+        token = credential.get_token(SCOPE)
+
+    assert token.token == "token"
+    assert transport.send.call_count == len(gone) + 1
+    assert imds._get_cached_probe_result(imds._get_imds_address()) is True
@@ -0,0 +1,63 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+from unittest import mock
+
+import pytest
+from azure.core.pipeline.policies import HeadersPolicy
+from azure.identity import CredentialUnavailableError
+from azure.identity._credentials import imds
+from azure.identity.aio._credentials import imds as aio_imds
+from azure.identity.aio._credentials.imds import ImdsCredential
+
+from test_imds_credential import (  # pylint:disable=unused-import
+    SCOPE,
+    clear_probe_results,
+    in_credential_chain,
+    mock_response,
+    no_pod_identity,
+    token_response,
+)
+
+
+def async_transport(*responses):
+    return mock.Mock(send=mock.AsyncMock(side_effect=responses), sleep=mock.AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_chained_request_retries_once_imds_is_available(in_credential_chain, no_pod_identity):
+    """IMDS responding 410 while an identity is provisioned gets the full retry schedule, not the probe's request"""
+
+    gone = [mock_response(status_code=410, json_payload={"error": "identity not ready"}) for _ in range(4)]
+    transport = async_transport(*gone, token_response("token"))
+    credential = ImdsCredential(transport=transport)
+
+    open_connection = mock.AsyncMock(return_value=(mock.Mock(), mock.Mock()))
+    with mock.patch(aio_imds.__name__ + ".asyncio.open_connection", open_connection):
+        token = await credential.get_token(SCOPE)
+
+    assert token.token == "token"
+    assert transport.send.call_count == len(gone) + 1
+    assert imds._get_cached_probe_result(imds._get_imds_address()) is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs,expected_message",
+    (
+        ({}, "No identity has been assigned to this resource."),
+        ({"client_id": "client-id"}, "The requested identity has not been assigned to this resource."),
+    ),
+)
+async def test_400_response_custom_policies(kwargs, expected_message):
+    """The credential handles a 400 itself when custom policies leave ImdsResponsePolicy out of the pipeline"""
+
+    error = {"error": "invalid_request", "error_description": "Identity not found"}
+    transport = async_transport(mock_response(status_code=400, json_payload=error))
+    credential = ImdsCredential(transport=transport, policies=[HeadersPolicy()], **kwargs)
+
+    with pytest.raises(CredentialUnavailableError) as ex:
+        await credential.get_token(SCOPE)
+    assert expected_message in ex.value.message
+    assert transport.send.call_count == 1
@@ -0,0 +1,91 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import time
+from unittest import mock
+
+import pytest
+from azure.identity import AzurePowerShellCredential, CredentialUnavailableError
+from azure.identity._constants import DEFAULT_REFRESH_OFFSET
+from azure.identity._credentials import azure_powershell
+from azure.identity._credentials.azure_powershell import POWERSHELL_NOT_INSTALLED
+
+SCOPE = "https://management.azure.com/.default"
+POWERSHELL_PATH = "/usr/bin/pwsh"
+
+
+def token_output(token, expires_on):
+    return "azsdk%{}%{}\n".format(token, expires_on)
+
+
+@pytest.fixture
+def powershell_installed():
+    with mock.patch(azure_powershell.__name__ + ".shutil.which", return_value=POWERSHELL_PATH) as which:
+        yield which
+
+
+def test_cache_hit(powershell_installed):
+    """A token that isn't near expiry is served from the cache, without starting PowerShell again"""
+
+    expires_on = int(time.time()) + 3600
+    with mock.patch(
+        azure_powershell.__name__ + ".run_command_line", return_value=token_output("token", expires_on)
+    ) as run_command_line:
+        credential = AzurePowerShellCredential()
+        first = credential.get_token(SCOPE)
+        second = credential.get_token(SCOPE)
+
+    assert first.token == second.token == "token"
+    assert second.expires_on == expires_on
+    assert run_command_line.call_count == 1
+    # PowerShell is located once per credential
+    assert powershell_installed.call_count == 1
+    assert run_command_line.call_args[0][0][0] == POWERSHELL_PATH
+
+
+def test_cache_miss_near_expiry(powershell_installed):
+    """A cached token within the refresh offset of expiring is replaced with a new one"""
+
+    expiring = int(time.time()) + DEFAULT_REFRESH_OFFSET - 1
+    fresh = int(time.time()) + 3600
+    with mock.patch(
+        azure_powershell.__name__ + ".run_command_line",
+        side_effect=(token_output("expiring", expiring), token_output("fresh", fresh)),
+    ) as run_command_line:
+        credential = AzurePowerShellCredential()
+        assert credential.get_token(SCOPE).token == "expiring"
+        token = credential.get_token(SCOPE)
+
+    assert token.token == "fresh"
+    assert token.expires_on == fresh
+    assert run_command_line.call_count == 2
+
+
+def test_cache_keyed_by_tenant(powershell_installed):
+    """Tokens for different tenants are cached separately"""
+
+    expires_on = int(time.time()) + 3600
+    with mock.patch(
+        azure_powershell.__name__ + ".run_command_line",
+        side_effect=(token_output("default", expires_on), token_output("other", expires_on)),
+    ) as run_command_line:
+        credential = AzurePowerShellCredential(additionally_allowed_tenants=["*"])
+        assert credential.get_token(SCOPE).token == "default"
+        assert credential.get_token(SCOPE, tenant_id="other-tenant").token == "other"
+        assert credential.get_token(SCOPE).token == "default"
+        assert credential.get_token(SCOPE, tenant_id="other-tenant").token == "other"
+
+    assert run_command_line.call_count == 2
+
+
+def test_powershell_not_installed():
+    """The credential is unavailable when neither pwsh nor powershell is on the path"""
+
+    with mock.patch(azure_powershell.__name__ + ".shutil.which", return_value=None):
+        with mock.patch(azure_powershell.__name__ + ".run_command_line") as run_command_line:
+            with pytest.raises(CredentialUnavailableError) as ex:
+                AzurePowerShellCredential().get_token(SCOPE)
+
+    assert ex.value.message == POWERSHELL_NOT_INSTALLED
+    assert run_command_line.call_count == 0
@@ -53,6 +53,8 @@ from typing import (
     Type,
     List,
     Mapping,
+    Tuple,
+    FrozenSet,
 )
 
 try:
@@ -232,6 +234,27 @@ except ImportError:
 
 _FLATTEN = re.compile(r"(?<!\\)\.")
 
+# Deserialization types which aren't parsed from an XML element's text
+_NON_TEXT_TYPES = frozenset(("object", "[]", "{}"))
+
+# Per model class: the readonly attributes, and every attribute which mustn't be passed to the model's __init__.
+# These only depend on the class's _validation and _subtype_map, so they're computed once rather than per instance.
+_MODEL_INIT_EXCLUSIONS: Dict[type, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
+
+def _get_init_exclusions(model_cls: type) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    try:
+        return _MODEL_INIT_EXCLUSIONS[model_cls]
+    except KeyError:
+        pass
+    validation = model_cls._validation  # type: ignore
+    readonly = tuple(k for k, v in validation.items() if v.get("readonly"))
+    const = [k for k, v in validation.items() if v.get("constant")]
+    subtype = getattr(model_cls, "_subtype_map", {})
+    exclusions = (readonly, frozenset(readonly).union(const, subtype))
+    _MODEL_INIT_EXCLUSIONS[model_cls] = exclusions
+    return exclusions
+
 
 def attribute_transformer(key, attr_desc, value):
     """A key transformer that returns the Python attribute.
@@ -593,9 +616,10 @@ class Serializer(object):
             serialized = target_obj._create_xml_node()
         try:
             attributes = target_obj._attribute_map
+            readonly = () if keep_readonly else _get_init_exclusions(type(target_obj))[0]
             for attr, attr_desc in attributes.items():
                 attr_name = attr
-                if not keep_readonly and target_obj._validation.get(attr_name, {}).get("readonly", False):
+                if attr_name in readonly:
                     continue
 
                 if attr_name == "additional_properties" and attr_desc["key"] == "":
@@ -1384,6 +1408,7 @@ class Deserializer(object):
             "iso-8601": (datetime.datetime),
         }
         self.dependencies: Dict[str, type] = dict(classes) if classes else {}
+        self._attribute_descriptions: Dict[type, Tuple[int, List[Tuple[str, Dict[str, Any]]]]] = {}
         self.key_extractors = [rest_key_extractor, xml_key_extractor]
         # Additional properties only works if the "rest_key_extractor" is used to
         # extract the keys. Making it to work whatever the key extractor is too much
@@ -1446,17 +1471,8 @@ class Deserializer(object):
         try:
             attributes = response._attribute_map  # type: ignore
             d_attrs = {}
-            for attr, attr_desc in attributes.items():
-                # Check empty string. If it's not empty, someone has a real "additionalProperties"...
-                if attr == "additional_properties" and attr_desc["key"] == "":
-                    continue
+            for attr, attr_desc in self._get_attribute_descriptions(response, attributes):
                 raw_value = None
-                # Enhance attr_desc with some dynamic data
-                attr_desc = attr_desc.copy()  # Do a copy, do not change the real one
-                internal_data_type = attr_desc["type"].strip("[]{}")
-                if internal_data_type in self.dependencies:
-                    attr_desc["internalType"] = self.dependencies[internal_data_type]
-
                 for key_extractor in self.key_extractors:
                     found_value = key_extractor(attr, attr_desc, data)
                     if found_value is not None:
@@ -1478,6 +1494,34 @@ class Deserializer(object):
             additional_properties = self._build_additional_properties(attributes, data)
             return self._instantiate_model(response, d_attrs, additional_properties)
 
+    def _get_attribute_descriptions(self, response, attributes):
+        """Get a model's attribute descriptions, each enhanced with the class of its internal type.
+
+        These depend only on the model class and this deserializer's dependencies, so they're built once per
+        class. They're rebuilt if the attribute map has grown, as enable_additional_properties_sending does.
+
+        :param response: The model class or instance to deserialize to.
+        :param dict attributes: The model's attribute map.
+        :rtype: list[tuple[str, dict]]
+        """
+        model_cls = response if isinstance(response, type) else type(response)
+        cached = self._attribute_descriptions.get(model_cls)
+        if cached is not None and cached[0] == len(attributes):
+            return cached[1]
+
+        descriptions = []
+        for attr, attr_desc in attributes.items():
+            # Check empty string. If it's not empty, someone has a real "additionalProperties"...
+            if attr == "additional_properties" and attr_desc["key"] == "":
+                continue
+            attr_desc = attr_desc.copy()  # Do a copy, do not change the real one
+            internal_data_type = attr_desc["type"].strip("[]{}")
+            if internal_data_type in self.dependencies:
+                attr_desc["internalType"] = self.dependencies[internal_data_type]
+            descriptions.append((attr, attr_desc))
+        self._attribute_descriptions[model_cls] = (len(attributes), descriptions)
+        return descriptions
+
     def _build_additional_properties(self, attribute_map, data):
         if not self.additional_properties_detection:
             return None
@@ -1581,11 +1625,9 @@ class Deserializer(object):
         :param d_attrs: The deserialized response attributes.
         """
         if callable(response):
-            subtype = getattr(response, "_subtype_map", {})
             try:
-                readonly = [k for k, v in response._validation.items() if v.get("readonly")]
-                const = [k for k, v in response._validation.items() if v.get("constant")]
-                kwargs = {k: v for k, v in attrs.items() if k not in subtype and k not in readonly + const}
+                readonly, excluded = _get_init_exclusions(response)
+                kwargs = {k: v for k, v in attrs.items() if k not in excluded}
                 response_obj = response(**kwargs)
                 for attr in readonly:
                     setattr(response_obj, attr, attrs.get(attr))
@@ -1621,15 +1663,14 @@ class Deserializer(object):
                 return data
             if data_type in self.basic_types.values():
                 return self.deserialize_basic(data, data_type)
-            if data_type in self.deserialize_type:
+            deserializer = self.deserialize_type.get(data_type)
+            if deserializer is not None:
                 if isinstance(data, self.deserialize_expected_types.get(data_type, tuple())):
                     return data
 
-                is_a_text_parsing_type = lambda x: x not in ["object", "[]", r"{}"]
-                if isinstance(data, ET.Element) and is_a_text_parsing_type(data_type) and not data.text:
+                if isinstance(data, ET.Element) and data_type not in _NON_TEXT_TYPES and not data.text:
                     return None
-                data_val = self.deserialize_type[data_type](data)
-                return data_val
+                return deserializer(data)
 
             iter_type = data_type[0] + data_type[-1]
             if iter_type in self.deserialize_type:
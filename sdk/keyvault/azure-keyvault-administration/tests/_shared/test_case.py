@@ -11,8 +11,11 @@ from azure.keyvault.keys._shared import HttpChallengeCache as _HttpChallengeCach
 
 
 class KeyVaultTestCase(AzureRecordedTestCase):
-    def _poll_until_no_exception(self, fn, expected_exception, max_retries=20, retry_delay=3):
-        """polling helper for live tests because some operations take an unpredictable amount of time to complete"""
+    def _poll_until_no_exception(self, fn, expected_exception, max_retries=20, retry_delay=3, initial_delay=0.5):
+        """polling helper for live tests because some operations take an unpredictable amount of time to complete
+
+        Sleeps start at initial_delay and double after each attempt, up to retry_delay.
+        """
 
         for i in range(max_retries):
             try:
@@ -21,16 +24,19 @@ class KeyVaultTestCase(AzureRecordedTestCase):
                 if i == max_retries - 1:
                     raise
                 if self.is_live:
-                    time.sleep(retry_delay)
+                    time.sleep(min(retry_delay, initial_delay * 2**i))
+
+    def _poll_until_exception(self, fn, expected_exception, max_retries=20, retry_delay=3, initial_delay=0.5):
+        """polling helper for live tests because some operations take an unpredictable amount of time to complete
 
-    def _poll_until_exception(self, fn, expected_exception, max_retries=20, retry_delay=3):
-        """polling helper for live tests because some operations take an unpredictable amount of time to complete"""
+        Sleeps start at initial_delay and double after each attempt, up to retry_delay.
+        """
 
-        for _ in range(max_retries):
+        for i in range(max_retries):
             try:
                 fn()
                 if self.is_live:
-                    time.sleep(retry_delay)
+                    time.sleep(min(retry_delay, initial_delay * 2**i))
             except expected_exception:
                 return
 
@@ -11,8 +11,13 @@ from azure.keyvault.keys._shared import HttpChallengeCache as _HttpChallengeCach
 
 
 class KeyVaultTestCase(AzureRecordedTestCase):
-    async def _poll_until_no_exception(self, fn, *resource_names, expected_exception, max_retries=20, retry_delay=3):
-        """polling helper for live tests because some operations take an unpredictable amount of time to complete"""
+    async def _poll_until_no_exception(
+        self, fn, *resource_names, expected_exception, max_retries=20, retry_delay=3, initial_delay=0.5
+    ):
+        """polling helper for live tests because some operations take an unpredictable amount of time to complete
+
+        Sleeps start at initial_delay and double after each attempt, up to retry_delay.
+        """
 
         for name in resource_names:
             for i in range(max_retries):
@@ -24,18 +29,23 @@ class KeyVaultTestCase(AzureRecordedTestCase):
                     if i == max_retries - 1:
                         raise
                     if self.is_live:
-                        await asyncio.sleep(retry_delay)
+                        await asyncio.sleep(min(retry_delay, initial_delay * 2**i))
+
+    async def _poll_until_exception(
+        self, fn, *resource_names, expected_exception, max_retries=20, retry_delay=3, initial_delay=0.5
+    ):
+        """polling helper for live tests because some operations take an unpredictable amount of time to complete
 
-    async def _poll_until_exception(self, fn, *resource_names, expected_exception, max_retries=20, retry_delay=3):
-        """polling helper for live tests because some operations take an unpredictable amount of time to complete"""
+        Sleeps start at initial_delay and double after each attempt, up to retry_delay.
+        """
 
         for name in resource_names:
-            for _ in range(max_retries):
+            for i in range(max_retries):
                 try:
                     # TODO: better for caller to apply args to fn; could also gather
                     await fn(name)
                     if self.is_live:
-                        await asyncio.sleep(retry_delay)
+                        await asyncio.sleep(min(retry_delay, initial_delay * 2**i))
                 except expected_exception:
                     return
         self.fail("expected exception {expected_exception} was not raised")
@@ -25,6 +25,8 @@ from .operations import (
     PrivateLinksOperations,
 )
 
+_ABSOLUTE_URL_PREFIXES = ("https://", "http://")
+
 if TYPE_CHECKING:
     # pylint: disable=unused-import,ungrouped-imports
     from azure.core.credentials import TokenCredential
@@ -119,7 +121,10 @@ class MongoClusterMgmtClient:  # pylint: disable=client-accepts-api-version-keyw
         """
 
         request_copy = deepcopy(request)
-        request_copy.url = self._client.format_url(request_copy.url)
+        # format_url returns an absolute URL without template braces unchanged, so skip its parsing
+        url = request_copy.url
+        if "{" in url or "}" in url or not url.startswith(_ABSOLUTE_URL_PREFIXES):
+            request_copy.url = self._client.format_url(url)
         return self._client.send_request(request_copy, stream=stream, **kwargs)  # type: ignore
 
     def close(self) -> None:
@@ -1,9 +1,8 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
+from functools import lru_cache
 from typing import Optional, Sequence
 
-# pylint:disable=no-name-in-module
-from fixedint import Int32
 # pylint:disable=W0611
 from opentelemetry.context import Context
 from opentelemetry.trace import Link, SpanKind, format_trace_id
@@ -20,8 +19,11 @@ from azure.monitor.opentelemetry.exporter._constants import _SAMPLE_RATE_KEY
 
 
 _HASH = 5381
-_INTEGER_MAX: int = Int32.maxval
-_INTEGER_MIN: int = Int32.minval
+_INTEGER_MAX: int = 2**31 - 1
+_INTEGER_MIN: int = -(2**31)
+_UINT32_MASK = 2**32 - 1
+# Number of trace ids whose sample scores each sampler remembers
+_SAMPLE_SCORE_CACHE_SIZE = 4096
 
 
 # Sampler is responsible for the following:
@@ -38,6 +40,24 @@ class ApplicationInsightsSampler(Sampler):
             raise ValueError("sampling_ratio must be in the range [0,1]")
         self._ratio = sampling_ratio
         self._sample_rate = sampling_ratio * 100
+        # SamplingResult exposes its attributes read-only and spans copy them, so spans created without attributes
+        # can all share this one
+        self._sample_rate_attributes = {_SAMPLE_RATE_KEY: self._sample_rate}
+        # Results for spans with neither attributes nor a parent trace state differ only by decision, and the SDK
+        # only reads them, so they're built once
+        self._shared_results = {
+            decision: SamplingResult(decision, self._sample_rate_attributes)
+            for decision in (Decision.DROP, Decision.RECORD_AND_SAMPLE)
+        }
+        # Sampling nothing or everything doesn't depend on the trace id
+        self._fixed_decision: Optional[Decision] = None
+        if self._sample_rate == 0:
+            self._fixed_decision = Decision.DROP
+        elif self._sample_rate == 100.0:
+            self._fixed_decision = Decision.RECORD_AND_SAMPLE
+        # Every span in a trace has the same trace id, and so the same score. Caching scores by trace id means only
+        # the first span of a trace pays for hashing it.
+        self._get_sample_score = lru_cache(maxsize=_SAMPLE_SCORE_CACHE_SIZE)(self._compute_sample_score)
 
     # pylint:disable=C0301
     # See https://github.com/microsoft/Telemetry-Collection-Spec/blob/main/OpenTelemetry/trace/ApplicationInsightsSampler.md
@@ -51,35 +71,44 @@ class ApplicationInsightsSampler(Sampler):
         links: Optional[Sequence["Link"]] = None,
         trace_state: Optional["TraceState"] = None,
     ) -> "SamplingResult":
-        if self._sample_rate == 0:
-            decision = Decision.DROP
-        elif self._sample_rate == 100.0:
-            decision = Decision.RECORD_AND_SAMPLE
-        else:
+        decision = self._fixed_decision
+        if decision is None:
             # Determine if should sample from ratio and traceId
-            sample_score = self._get_DJB2_sample_score(format_trace_id(trace_id).lower())
+            sample_score = self._get_sample_score(trace_id)
             if sample_score < self._ratio:
                 decision = Decision.RECORD_AND_SAMPLE
             else:
                 decision = Decision.DROP
+        parent_trace_state = _get_parent_trace_state(parent_context) # type: ignore
         # Add sample rate as span attribute
         if attributes is None:
-            attributes = {}
-        attributes[_SAMPLE_RATE_KEY] = self._sample_rate # type: ignore
+            if parent_trace_state is None:
+                return self._shared_results[decision]
+            attributes = self._sample_rate_attributes
+        else:
+            attributes[_SAMPLE_RATE_KEY] = self._sample_rate # type: ignore
         return SamplingResult(
             decision,
             attributes,
-            _get_parent_trace_state(parent_context), # type: ignore
+            parent_trace_state,
         )
 
+    def _compute_sample_score(self, trace_id: int) -> float:
+        # format_trace_id already gives lowercase hex
+        return self._get_DJB2_sample_score(format_trace_id(trace_id))
+
     def _get_DJB2_sample_score(self, trace_id_hex: str) -> float:
-        # This algorithm uses 32bit integers
-        hash_value = Int32(_HASH)
-        for char in trace_id_hex:
-            hash_value = ((hash_value << 5) + hash_value) + ord(char)
+        # This algorithm uses 32bit integers. Keeping the hash as an unsigned 32 bit value in a plain int, and
+        # reinterpreting it as signed at the end, gives the same result as wrapping every operation.
+        hash_value = _HASH
+        # the hex digits are ASCII, so their encoded bytes are their ordinals
+        for char_code in trace_id_hex.encode("ascii"):
+            hash_value = (((hash_value << 5) + hash_value) + char_code) & _UINT32_MASK
+        if hash_value > _INTEGER_MAX:
+            hash_value -= _UINT32_MASK + 1
 
         if hash_value == _INTEGER_MIN:
-            hash_value = int(_INTEGER_MAX)
+            hash_value = _INTEGER_MAX
         else:
             hash_value = abs(hash_value)
 
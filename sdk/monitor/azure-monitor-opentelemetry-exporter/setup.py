@@ -83,7 +83,6 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "azure-core<2.0.0,>=1.28.0",
-        "fixedint==0.1.6",
         "msrest>=0.6.10",
         "opentelemetry-api~=1.21",
         "opentelemetry-sdk~=1.21",
@@ -45,6 +45,40 @@ class TestApplicationInsightsSampler(unittest.TestCase):
         self.assertEqual(result.attributes["_MS.sampleRate"], 50)
         self.assertFalse(result.decision.is_sampled())
 
+    @mock.patch.object(ApplicationInsightsSampler, '_get_DJB2_sample_score')
+    def test_should_sample_fixed_ratios(self, score_mock):
+        result = ApplicationInsightsSampler(1.0).should_sample(None, 0, "test")
+        self.assertEqual(result.attributes["_MS.sampleRate"], 100)
+        self.assertTrue(result.decision.is_sampled())
+        result = ApplicationInsightsSampler(0.0).should_sample(None, 0, "test")
+        self.assertEqual(result.attributes["_MS.sampleRate"], 0)
+        self.assertFalse(result.decision.is_sampled())
+        score_mock.assert_not_called()
+
+    @mock.patch.object(ApplicationInsightsSampler, '_get_DJB2_sample_score')
+    def test_should_sample_scores_trace_once(self, score_mock):
+        sampler = ApplicationInsightsSampler(0.5)
+        score_mock.return_value = 0.2
+        sampler.should_sample(None, 1, "parent")
+        sampler.should_sample(None, 1, "child")
+        sampler.should_sample(None, 2, "test")
+        self.assertEqual(score_mock.call_count, 2)
+
+    def test_should_sample_shares_root_results(self):
+        sampler = ApplicationInsightsSampler(1.0)
+        result = sampler.should_sample(None, 1, "test")
+        self.assertIs(sampler.should_sample(None, 2, "test"), result)
+        self.assertEqual(result.attributes["_MS.sampleRate"], 100)
+        self.assertIsNot(sampler.should_sample(None, 1, "test", attributes={}), result)
+
+    def test_get_DJB2_sample_score(self):
+        sampler = ApplicationInsightsSampler(0.5)
+        self.assertEqual(sampler._get_DJB2_sample_score("0" * 32), 0.02339351411135565)
+        self.assertEqual(
+            sampler._get_DJB2_sample_score("0102030405060708090a0b0c0d0e0f10"), 0.9460300546819485
+        )
+        self.assertEqual(sampler._get_DJB2_sample_score("f" * 32), 0.9996135514227736)
+
     def test_sampler_factory(self):
         sampler = azure_monitor_opentelemetry_sampler_factory("1.0")
         self.assertEqual(sampler._ratio, 1.0)
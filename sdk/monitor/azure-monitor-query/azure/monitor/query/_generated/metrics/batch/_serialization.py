@@ -33,6 +33,7 @@ import datetime
 import decimal
 import email
 from enum import Enum
+from functools import lru_cache
 import json
 import logging
 import re
@@ -68,6 +69,9 @@ from azure.core.serialization import NULL as CoreNull
 
 _BOM = codecs.BOM_UTF8.decode(encoding="utf-8")
 
+# Requests tend to reuse a handful of durations (e.g. metric granularities), so their ISO 8601 forms are cached
+_format_timedelta = lru_cache(maxsize=64)(isodate.duration_isoformat)
+
 ModelType = TypeVar("ModelType", bound="Model")
 JSON = MutableMapping[str, Any]
 
@@ -1111,6 +1115,8 @@ class Serializer(object):
         """
         if isinstance(attr, str):
             attr = isodate.parse_duration(attr)
+        if isinstance(attr, datetime.timedelta):
+            return _format_timedelta(attr)
         return isodate.duration_isoformat(attr)
 
     @staticmethod
@@ -181,9 +181,9 @@ def get_subscription_id_from_resource(resource_id: str) -> str:
     if not resource_id:
         raise ValueError("Resource ID must not be None or empty.")
 
-    parts = resource_id.split("subscriptions/")
-    if len(parts) != 2:
+    # partition rather than split, so only the text after the marker is scanned again and no list is built
+    _, marker, rest = resource_id.partition("subscriptions/")
+    if not marker or "subscriptions/" in rest:
         raise ValueError("Resource ID must contain a subscription ID.")
 
-    subscription_id = parts[1].split("/")[0]
-    return subscription_id
+    return rest.partition("/")[0]
@@ -53,8 +53,8 @@ class MetricsClient:  # pylint: disable=client-accepts-api-version-keyword
 
     def __init__(self, endpoint: str, credential: AsyncTokenCredential, **kwargs: Any) -> None:
         self._endpoint = endpoint
-        if not self._endpoint.startswith("https://") and not self._endpoint.startswith("http://"):
-            self._endpoint = "https://" + self._endpoint
+        if not self._endpoint.startswith(("https://", "http://")):
+            self._endpoint = f"https://{self._endpoint}"
         audience = kwargs.pop("audience", "https://metrics.monitor.azure.com")
 
         authentication_policy = kwargs.pop("authentication_policy", None) or get_authentication_policy(
@@ -159,7 +159,8 @@ class MetricsClient:  # pylint: disable=client-accepts-api-version-keyword
         metric_names = [x.replace(",", "%2") for x in metric_names]
 
         start_time, end_time = get_timespan_iso8601_endpoints(timespan)
-        resource_id_json: JSON = {"resourceids": list(resource_ids)}
+        # the body only needs a JSON array, so a list is sent as is rather than copied
+        resource_id_json: JSON = {"resourceids": resource_ids if isinstance(resource_ids, list) else list(resource_ids)}
         subscription_id = get_subscription_id_from_resource(resource_ids[0])
 
         generated = await self._batch_metrics_op.batch(
@@ -183,10 +184,8 @@ class MetricsClient:  # pylint: disable=client-accepts-api-version-keyword
         if isinstance(generated, str):
             generated = loads(generated)
 
-        return [
-            MetricsQueryResult._from_generated(value)  # pylint: disable=protected-access
-            for value in generated["values"]
-        ]
+        # map binds _from_generated once rather than looking it up for every value
+        return list(map(MetricsQueryResult._from_generated, generated["values"]))  # pylint: disable=protected-access
 
     async def __aenter__(self) -> "MetricsClient":
         await self._client.__aenter__()
@@ -28,6 +28,9 @@ def test_get_subscription_id_from_resource():
     with pytest.raises(ValueError):
         get_subscription_id_from_resource("")
 
+    with pytest.raises(ValueError):
+        get_subscription_id_from_resource("/subscriptions/sub1/resourceGroups/rg/subscriptions/sub2")
+
 
 def test_get_timespan_iso6801_endpoints():
     start, end = datetime(2020, 1, 1), datetime(2020, 1, 2)
@@ -557,6 +557,7 @@ class Serializer(object):
         self.dependencies: Dict[str, type] = dict(classes) if classes else {}
         self.key_transformer = full_restapi_key_transformer
         self.client_side_validation = True
+        self._body_deserializers: Dict[bool, "Deserializer"] = {}
 
     def _serialize(self, target_obj, data_type=None, **kwargs):
         """Serialize data into a string according to type.
@@ -687,26 +688,46 @@ class Serializer(object):
                 is_xml_model_serialization = False
         if internal_data_type and not isinstance(internal_data_type, Enum):
             try:
-                deserializer = Deserializer(self.dependencies)
-                # Since it's on serialization, it's almost sure that format is not JSON REST
-                # We're not able to deal with additional properties for now.
-                deserializer.additional_properties_detection = False
-                if is_xml_model_serialization:
-                    deserializer.key_extractors = [  # type: ignore
-                        attribute_key_case_insensitive_extractor,
-                    ]
-                else:
-                    deserializer.key_extractors = [
-                        rest_key_case_insensitive_extractor,
-                        attribute_key_case_insensitive_extractor,
-                        last_rest_key_case_insensitive_extractor,
-                    ]
+                deserializer = self._get_body_deserializer(bool(is_xml_model_serialization))
                 data = deserializer._deserialize(data_type, data)
             except DeserializationError as err:
                 raise SerializationError("Unable to build a model: " + str(err)) from err
 
         return self._serialize(data, data_type, **kwargs)
 
+    def _get_body_deserializer(self, is_xml: bool) -> "Deserializer":
+        """Get the deserializer body() builds models with, creating it on first use.
+
+        The deserializer holds no per-call state, so one per format is reused rather than building a new one,
+        and copying the dependencies, for every request body.
+
+        :param bool is_xml: Whether the body is serialized as XML.
+        :return: The deserializer for the given format.
+        :rtype: Deserializer
+        """
+        try:
+            return self._body_deserializers[is_xml]
+        except KeyError:
+            pass
+        deserializer = Deserializer()
+        # share the dependencies rather than copying them, so models added to this serializer later are found
+        deserializer.dependencies = self.dependencies
+        # Since it's on serialization, it's almost sure that format is not JSON REST
+        # We're not able to deal with additional properties for now.
+        deserializer.additional_properties_detection = False
+        if is_xml:
+            deserializer.key_extractors = [  # type: ignore
+                attribute_key_case_insensitive_extractor,
+            ]
+        else:
+            deserializer.key_extractors = [
+                rest_key_case_insensitive_extractor,
+                attribute_key_case_insensitive_extractor,
+                last_rest_key_case_insensitive_extractor,
+            ]
+        self._body_deserializers[is_xml] = deserializer
+        return deserializer
+
     def url(self, name, data, data_type, **kwargs):
         """Serialize data intended for a URL path.
 
@@ -6,9 +6,70 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from typing import Any, Iterable, List
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from ... import models as _models
+from ._recovery_services_operations import RecoveryServicesOperations as RecoveryServicesOperationsGenerated
+
+__all__: List[str] = ["RecoveryServicesOperations"]
+
+
+class RecoveryServicesOperations(RecoveryServicesOperationsGenerated):
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~azure.mgmt.recoveryservices.aio.RecoveryServicesClient`'s
+        :attr:`recovery_services` attribute.
+    """
+
+    async def check_names_availability_batch(
+        self,
+        resource_group_name: str,
+        location: str,
+        inputs: Iterable[_models.CheckNameAvailabilityParameters],
+        *,
+        max_concurrency: int = 16,
+        **kwargs: Any
+    ) -> List[_models.CheckNameAvailabilityResult]:
+        """Check the availability of several resource names concurrently.
+
+        Sends one check_name_availability request per input, with at most ``max_concurrency`` requests in
+        flight, so checking many names costs about as many round trips as ``len(inputs) / max_concurrency``
+        rather than one per name.
+
+        :param resource_group_name: The name of the resource group. The name is case insensitive.
+         Required.
+        :type resource_group_name: str
+        :param location: Location of the resource. Required.
+        :type location: str
+        :param inputs: Resource types and names to check. Required.
+        :type inputs: list[~azure.mgmt.recoveryservices.models.CheckNameAvailabilityParameters]
+        :keyword int max_concurrency: Maximum number of requests sent at once. Defaults to 16.
+        :return: A CheckNameAvailabilityResult for each input, in the order of ``inputs``
+        :rtype: list[~azure.mgmt.recoveryservices.models.CheckNameAvailabilityResult]
+        :raises ValueError: if ``max_concurrency`` is less than 1
+        :raises ~azure.core.exceptions.HttpResponseError: the first error raised by any of the requests
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def check(parameters: _models.CheckNameAvailabilityParameters) -> _models.CheckNameAvailabilityResult:
+            async with semaphore:
+                return await self.check_name_availability(resource_group_name, location, parameters, **kwargs)
+
+        tasks = [asyncio.ensure_future(check(parameters)) for parameters in inputs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # gather doesn't cancel the other checks when one fails; don't leave them sending requests
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
 
 def patch_sdk():
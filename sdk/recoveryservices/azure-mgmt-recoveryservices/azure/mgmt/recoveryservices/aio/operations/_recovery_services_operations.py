@@ -7,16 +7,9 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 from io import IOBase
-from typing import Any, Callable, Dict, IO, Optional, TypeVar, Union, overload
-
-from azure.core.exceptions import (
-    ClientAuthenticationError,
-    HttpResponseError,
-    ResourceExistsError,
-    ResourceNotFoundError,
-    ResourceNotModifiedError,
-    map_error,
-)
+from typing import Any, Callable, Dict, IO, Mapping, Optional, Type, TypeVar, Union, overload
+
+from azure.core.exceptions import HttpResponseError, map_error
 from azure.core.pipeline import PipelineResponse
 from azure.core.pipeline.transport import AsyncHttpResponse
 from azure.core.rest import HttpRequest
@@ -27,6 +20,7 @@ from azure.mgmt.core.exceptions import ARMErrorFormat
 from ... import models as _models
 from ..._vendor import _convert_request
 from ...operations._recovery_services_operations import (
+    _DEFAULT_ERROR_MAP,
     build_capabilities_request,
     build_check_name_availability_request,
 )
@@ -161,13 +155,10 @@ class RecoveryServicesOperations:
         :rtype: ~azure.mgmt.recoveryservices.models.CheckNameAvailabilityResult
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        error_map: Mapping[int, Type[HttpResponseError]] = _DEFAULT_ERROR_MAP
+        user_error_map = kwargs.pop("error_map", None)
+        if user_error_map:
+            error_map = {**_DEFAULT_ERROR_MAP, **user_error_map}
 
         _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
         _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
@@ -280,13 +271,10 @@ class RecoveryServicesOperations:
         :rtype: ~azure.mgmt.recoveryservices.models.CapabilitiesResponse
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        error_map: Mapping[int, Type[HttpResponseError]] = _DEFAULT_ERROR_MAP
+        user_error_map = kwargs.pop("error_map", None)
+        if user_error_map:
+            error_map = {**_DEFAULT_ERROR_MAP, **user_error_map}
 
         _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
         _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
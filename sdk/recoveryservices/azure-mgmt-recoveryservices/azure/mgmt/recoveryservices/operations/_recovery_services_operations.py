@@ -7,7 +7,7 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 from io import IOBase
-from typing import Any, Callable, Dict, IO, Optional, TypeVar, Union, overload
+from typing import Any, Callable, Dict, IO, Mapping, Optional, Type, TypeVar, Union, overload
 
 from azure.core.exceptions import (
     ClientAuthenticationError,
@@ -34,6 +34,14 @@ ClsType = Optional[Callable[[PipelineResponse[HttpRequest, HttpResponse], T, Dic
 _SERIALIZER = Serializer()
 _SERIALIZER.client_side_validation = False
 
+# map_error only reads the map, so operations share this one unless the caller passes overrides
+_DEFAULT_ERROR_MAP: Mapping[int, Type[HttpResponseError]] = {
+    401: ClientAuthenticationError,
+    404: ResourceNotFoundError,
+    409: ResourceExistsError,
+    304: ResourceNotModifiedError,
+}
+
 
 def build_check_name_availability_request(
     resource_group_name: str, location: str, subscription_id: str, **kwargs: Any
@@ -227,13 +235,10 @@ class RecoveryServicesOperations:
         :rtype: ~azure.mgmt.recoveryservices.models.CheckNameAvailabilityResult
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        error_map: Mapping[int, Type[HttpResponseError]] = _DEFAULT_ERROR_MAP
+        user_error_map = kwargs.pop("error_map", None)
+        if user_error_map:
+            error_map = {**_DEFAULT_ERROR_MAP, **user_error_map}
 
         _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
         _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
@@ -346,13 +351,10 @@ class RecoveryServicesOperations:
         :rtype: ~azure.mgmt.recoveryservices.models.CapabilitiesResponse
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        error_map: Mapping[int, Type[HttpResponseError]] = _DEFAULT_ERROR_MAP
+        user_error_map = kwargs.pop("error_map", None)
+        if user_error_map:
+            error_map = {**_DEFAULT_ERROR_MAP, **user_error_map}
 
         _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
         _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
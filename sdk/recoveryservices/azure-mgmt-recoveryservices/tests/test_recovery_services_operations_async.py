@@ -0,0 +1,83 @@
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------
+import asyncio
+from unittest import mock
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+from azure.mgmt.recoveryservices import models
+from azure.mgmt.recoveryservices.aio.operations import RecoveryServicesOperations
+
+
+def get_operations():
+    return RecoveryServicesOperations(mock.Mock(), mock.Mock(), mock.Mock(), mock.Mock())
+
+
+def test_check_names_availability_batch_order_and_concurrency():
+    names = ["vault{}".format(i) for i in range(10)]
+    inputs = [models.CheckNameAvailabilityParameters(type="Microsoft.RecoveryServices/Vaults", name=n) for n in names]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def check_name_availability(resource_group_name, location, parameters, **kwargs):
+        nonlocal in_flight, max_in_flight
+        assert (resource_group_name, location) == ("rg", "westus")
+        assert kwargs == {"headers": {"x": "y"}}
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # finish later inputs first, so results only come back in input order if the batch orders them
+        await asyncio.sleep(0.001 * (len(names) - names.index(parameters.name)))
+        in_flight -= 1
+        return models.CheckNameAvailabilityResult(name_available=True, message=parameters.name)
+
+    operations = get_operations()
+    with mock.patch.object(operations, "check_name_availability", side_effect=check_name_availability) as check:
+        results = asyncio.run(
+            operations.check_names_availability_batch("rg", "westus", inputs, max_concurrency=3, headers={"x": "y"})
+        )
+
+    assert [result.message for result in results] == names
+    assert check.call_count == len(names)
+    assert max_in_flight == 3
+
+
+@pytest.mark.parametrize("max_concurrency", (0, -1))
+def test_check_names_availability_batch_max_concurrency(max_concurrency):
+    operations = get_operations()
+    with mock.patch.object(operations, "check_name_availability") as check:
+        with pytest.raises(ValueError):
+            asyncio.run(operations.check_names_availability_batch("rg", "westus", [], max_concurrency=max_concurrency))
+    assert check.call_count == 0
+
+
+def test_check_names_availability_batch_error():
+    """A failed check cancels the rest, rather than leaving them to send requests"""
+
+    names = ["vault{}".format(i) for i in range(10)]
+    inputs = [models.CheckNameAvailabilityParameters(type="Microsoft.RecoveryServices/Vaults", name=n) for n in names]
+    finished = []
+
+    async def check_name_availability(resource_group_name, location, parameters, **kwargs):
+        if parameters.name == "vault1":
+            raise HttpResponseError("check failed")
+        await asyncio.sleep(0.01)
+        finished.append(parameters.name)
+        return models.CheckNameAvailabilityResult(name_available=True, message=parameters.name)
+
+    async def run():
+        with pytest.raises(HttpResponseError):
+            await operations.check_names_availability_batch("rg", "westus", inputs, max_concurrency=2)
+        calls = check.call_count
+        # had the other checks been left running, they would finish and start more by now
+        await asyncio.sleep(0.1)
+        return calls
+
+    operations = get_operations()
+    with mock.patch.object(operations, "check_name_availability", side_effect=check_name_availability) as check:
+        calls_when_raised = asyncio.run(run())
+
+    assert check.call_count == calls_when_raised < len(names)
+    assert finished == []